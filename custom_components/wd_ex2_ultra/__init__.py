@@ -1,15 +1,35 @@
 """WD MyCloud EX2 Ultra SNMP Integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, CONF_SCAN_INTERVAL, SENSORS
-from .snmp_helper import fetch_snmp_data
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_SCAN_INTERVAL,
+    CONF_REFRESH_OIDS_CACHE_INTERVAL,
+    DEFAULT_REFRESH_OIDS_CACHE_INTERVAL,
+    CONF_PARALLEL_WALKS,
+    DEFAULT_PARALLEL_WALKS,
+    HOST_RESOLVE_INTERVAL,
+    SENSORS,
+)
+from .snmp_helper import (
+    SnmpSession,
+    build_scalar_requests,
+    close_snmp_session,
+    create_transport_target,
+    fetch_inventory,
+    fetch_snmp_data,
+    open_snmp_session,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,20 +46,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval=timedelta(seconds=scan_interval),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Setup is retried with a new coordinator; release this one's engine
+        coordinator.close_session()
+        raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: WDEx2UltraCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.close_session()
     return unload_ok
 
 
@@ -60,10 +92,88 @@ class WDEx2UltraCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
         self.entry = entry
+        # Backstop for a whole update, see _async_update_data()
+        self._update_budget = update_interval.total_seconds() * 0.8
+        # SNMP engine, auth data and transport target are created on the
+        # first update and reused for every later poll.
+        self._session: SnmpSession | None = None
+        self._target_expiry = 0.0
+        self._scalar_requests: list | None = None
+        # Slow-changing disk/volume columns and cached row OIDs,
+        # see fetch_inventory()
+        self._inventory: dict = {
+            "disks": {}, "volumes": {}, "disk_oids": [], "volume_oids": []
+        }
+        self._inventory_expiry = 0.0
+        self._inventory_interval = entry.options.get(
+            CONF_REFRESH_OIDS_CACHE_INTERVAL, DEFAULT_REFRESH_OIDS_CACHE_INTERVAL
+        )
+        self._parallel = entry.options.get(CONF_PARALLEL_WALKS, DEFAULT_PARALLEL_WALKS)
+
+    def close_session(self) -> None:
+        """Release the cached SNMP engine."""
+        if self._session is not None:
+            close_snmp_session(self._session)
+            self._session = None
 
     async def _async_update_data(self) -> dict:
-        """Fetch data from WD EX2 Ultra via SNMP."""
+        """Fetch data from WD EX2 Ultra via SNMP.
+
+        A request the NAS does not answer fails the update (UpdateFailed) at
+        every scan interval. The number of requests an update sends depends
+        on the inventory and the fallbacks it needs, so pysnmp keeps its
+        normal timeout and the whole update is cut off at 80 % of the scan
+        interval instead, so it cannot run into the next one.
+        """
+        timeout = self._update_budget
         try:
-            return await fetch_snmp_data(dict(self.entry.data), SENSORS)
+            if self._session is None:
+                self._session = await open_snmp_session(dict(self.entry.data))
+                self._scalar_requests = build_scalar_requests(SENSORS)
+            async with asyncio.timeout(timeout):
+                if time.monotonic() >= self._target_expiry:
+                    await self._async_resolve_target()
+                if time.monotonic() >= self._inventory_expiry:
+                    await self._async_refresh_inventory()
+                return await fetch_snmp_data(
+                    self._session, self._scalar_requests, self._inventory, self._parallel
+                )
+        except TimeoutError as err:
+            self._target_expiry = 0.0
+            raise UpdateFailed(f"SNMP update timed out after {timeout:.0f}s") from err
         except Exception as err:
+            # The NAS may have moved to a new address – resolve again next poll
+            self._target_expiry = 0.0
             raise UpdateFailed(f"SNMP update failed: {err}") from err
+
+    async def _async_resolve_target(self) -> None:
+        """Resolve the NAS host name and rebuild the transport target.
+
+        If resolution fails while a target exists, the old one is kept.
+        """
+        try:
+            target = await create_transport_target(self.entry.data[CONF_HOST])
+        except Exception as err:
+            if self._session.target is None:
+                raise
+            _LOGGER.debug("Could not re-resolve %s: %s", self.entry.data[CONF_HOST], err)
+            return
+        self._session.target = target
+        self._target_expiry = time.monotonic() + HOST_RESOLVE_INTERVAL
+
+    async def _async_refresh_inventory(self) -> None:
+        """Re-walk the disk and volume tables and refresh the OID cache.
+
+        A table whose walk fails keeps its previous rows. The refresh interval
+        only starts once both walks succeeded and found at least one row;
+        otherwise the walk is retried on the next poll.
+        """
+        inventory, complete = await fetch_inventory(
+            self._session, self._inventory, self._parallel
+        )
+        if complete and not inventory["disks"] and not inventory["volumes"]:
+            # Nothing found at all – keep what we had and try again
+            return
+        self._inventory = inventory
+        if complete:
+            self._inventory_expiry = time.monotonic() + self._inventory_interval
@@ -7,6 +7,7 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
@@ -20,12 +21,17 @@ from .const import (
     CONF_PRIV_PROTOCOL,
     CONF_PRIV_PASSWORD,
     CONF_SCAN_INTERVAL,
+    CONF_REFRESH_OIDS_CACHE_INTERVAL,
     SNMP_VERSION_V2C,
     SNMP_VERSION_V3,
     AUTH_PROTOCOLS,
     PRIV_PROTOCOLS,
     SCAN_INTERVAL_OPTIONS,
     DEFAULT_SCAN_INTERVAL,
+    REFRESH_OIDS_CACHE_INTERVAL_OPTIONS,
+    DEFAULT_REFRESH_OIDS_CACHE_INTERVAL,
+    CONF_PARALLEL_WALKS,
+    DEFAULT_PARALLEL_WALKS,
 )
 from .snmp_helper import (
     CannotConnect,
@@ -47,6 +53,14 @@ class WDEx2UltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Initialize config flow."""
         self._snmp_version: str | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Return the options flow."""
+        return WDEx2UltraOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -157,3 +171,34 @@ class WDEx2UltraConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             }
         )
         return self.async_show_form(step_id="v3", data_schema=schema, errors=errors)
+
+
+class WDEx2UltraOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for WD MyCloud EX2 Ultra."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the polling options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_REFRESH_OIDS_CACHE_INTERVAL,
+                    default=self.config_entry.options.get(
+                        CONF_REFRESH_OIDS_CACHE_INTERVAL,
+                        DEFAULT_REFRESH_OIDS_CACHE_INTERVAL,
+                    ),
+                ): vol.In(REFRESH_OIDS_CACHE_INTERVAL_OPTIONS),
+                vol.Required(
+                    CONF_PARALLEL_WALKS,
+                    default=self.config_entry.options.get(
+                        CONF_PARALLEL_WALKS,
+                        DEFAULT_PARALLEL_WALKS,
+                    ),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
@@ -1,4 +1,7 @@
 """Constants for the WD MyCloud EX2 Ultra integration."""
+from __future__ import annotations
+
+from dataclasses import dataclass
 
 DOMAIN = "wd_ex2_ultra"
 
@@ -13,6 +16,10 @@ CONF_PRIV_PROTOCOL = "priv_protocol"
 CONF_PRIV_PASSWORD = "priv_password"
 CONF_SCAN_INTERVAL = "scan_interval"
 
+# Option keys
+CONF_REFRESH_OIDS_CACHE_INTERVAL = "refresh_oids_cache_interval"
+CONF_PARALLEL_WALKS = "parallel_walks"
+
 # SNMP versions
 SNMP_VERSION_V2C = "SNMPv2c"
 SNMP_VERSION_V3 = "SNMPv3"
@@ -24,9 +31,30 @@ AUTH_PROTOCOLS = ["MD5", "SHA"]
 PRIV_PROTOCOLS = ["DES", "AES"]
 
 # Polling interval options (seconds)
-SCAN_INTERVAL_OPTIONS = [30, 60, 120]
+SCAN_INTERVAL_OPTIONS = [10, 15, 30, 60, 120]
 DEFAULT_SCAN_INTERVAL = 60
 
+# pysnmp timeout (seconds) and retries per request. An update as a whole is
+# bounded by the coordinator, see WDEx2UltraCoordinator._async_update_data.
+SNMP_TIMEOUT = 5.0
+SNMP_RETRIES = 1
+
+# The NAS host name is resolved when the transport target is created and
+# re-resolved this often (seconds), or after a failed update.
+HOST_RESOLVE_INTERVAL = 86400
+
+# Disk vendor/model/serial/capacity and the volume layout are only
+# re-walked this often (seconds). The walk also caches the OIDs of the
+# changing columns (disk temperature/status, volume free space), which
+# every poll then reads with a plain GET.
+REFRESH_OIDS_CACHE_INTERVAL_OPTIONS = [900, 3600, 21600, 86400]
+DEFAULT_REFRESH_OIDS_CACHE_INTERVAL = 3600
+
+# Send the scalar, disk and volume requests of a poll (and the disk and
+# volume walks of an inventory refresh) concurrently. Agents that drop
+# concurrent requests can switch this off to query one table at a time.
+DEFAULT_PARALLEL_WALKS = True
+
 # ============================================================
 # WD MYCLOUDEX2ULTRA-MIB base OID
 # enterprises(1.3.6.1.4.1) . WD(5127) . productID(1) . projectID(1)
@@ -46,7 +74,7 @@ WD_OID_HOSTNAME      = WD_NAS_AGENT + ".3.0"   # mycloudex2ultraHostName
 # Entry:  nasAgent.10.1
 # Cols:   .1 DiskNum  .2 Vendor  .3 Model  .4 Serial  .5 Temperature  .6 Capacity  .7 Status
 WD_DISK_TABLE_ROOT      = WD_NAS_AGENT + ".10"
-WD_DISK_COL_NUM         = WD_NAS_AGENT + ".10.1.1"  # walk this to find disk indices
+WD_DISK_COL_NUM         = WD_NAS_AGENT + ".10.1.1"  # not walked; indices come from the data columns
 WD_DISK_COL_VENDOR      = WD_NAS_AGENT + ".10.1.2"
 WD_DISK_COL_MODEL       = WD_NAS_AGENT + ".10.1.3"
 WD_DISK_COL_SERIAL      = WD_NAS_AGENT + ".10.1.4"
@@ -92,117 +120,138 @@ IF_HC_OUT_OCTETS_ETH0 = "1.3.6.1.2.1.31.1.1.1.10.2"  # ifHCOutOctets.2
 
 # ============================================================
 # Static sensors (scalar OIDs, fetched with get_cmd)
-# Sensors with "computed": True are not fetched via SNMP but
-# computed in snmp_helper.fetch_snmp_data from other values.
+# Sensors with computed=True are not fetched via SNMP but
+# computed in snmp_helper.fetch_scalar_data from other values.
+# parser selects how the raw value is converted (see
+# snmp_helper._PARSERS).
 # ============================================================
-SENSORS = [
-    {
-        "key": "cpu_load_1min",
-        "name": "CPU Load 1min",
-        "oid": "1.3.6.1.4.1.2021.10.1.3.1",
-        "unit": "%",
-        "icon": "mdi:cpu-64-bit",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    {
-        "key": "cpu_load_5min",
-        "name": "CPU Load 5min",
-        "oid": "1.3.6.1.4.1.2021.10.1.3.2",
-        "unit": "%",
-        "icon": "mdi:cpu-64-bit",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    {
-        "key": "cpu_load_15min",
-        "name": "CPU Load 15min",
-        "oid": "1.3.6.1.4.1.2021.10.1.3.3",
-        "unit": "%",
-        "icon": "mdi:cpu-64-bit",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    {
-        "key": "ram_total",
-        "name": "RAM Total",
-        "oid": "1.3.6.1.4.1.2021.4.5.0",   # memTotalReal
-        "unit": "MiB",
-        "icon": "mdi:memory",
-        "device_class": None,
-        "state_class": "measurement",
-        "transform": "kb_to_mib",
-    },
-    {
-        "key": "ram_free",
-        "name": "RAM Free",
+
+
+@dataclass(frozen=True, slots=True)
+class SensorSpec:
+    """Definition of a static scalar sensor."""
+
+    key: str
+    name: str
+    oid: str | None
+    unit: str
+    icon: str
+    device_class: str | None
+    state_class: str | None
+    parser: str = "number"
+    computed: bool = False
+
+
+SENSORS: tuple[SensorSpec, ...] = (
+    SensorSpec(
+        key="cpu_load_1min",
+        name="CPU Load 1min",
+        oid="1.3.6.1.4.1.2021.10.1.3.1",
+        unit="%",
+        icon="mdi:cpu-64-bit",
+        device_class=None,
+        state_class="measurement",
+    ),
+    SensorSpec(
+        key="cpu_load_5min",
+        name="CPU Load 5min",
+        oid="1.3.6.1.4.1.2021.10.1.3.2",
+        unit="%",
+        icon="mdi:cpu-64-bit",
+        device_class=None,
+        state_class="measurement",
+    ),
+    SensorSpec(
+        key="cpu_load_15min",
+        name="CPU Load 15min",
+        oid="1.3.6.1.4.1.2021.10.1.3.3",
+        unit="%",
+        icon="mdi:cpu-64-bit",
+        device_class=None,
+        state_class="measurement",
+    ),
+    SensorSpec(
+        key="ram_total",
+        name="RAM Total",
+        oid="1.3.6.1.4.1.2021.4.5.0",   # memTotalReal
+        unit="MiB",
+        icon="mdi:memory",
+        device_class=None,
+        state_class="measurement",
+        parser="kb_to_mib",
+    ),
+    SensorSpec(
+        key="ram_free",
+        name="RAM Free",
         # memAvailReal – actual free physical RAM only.
         # Previously used memTotalFree (.4.11.0) which includes swap space
         # and could therefore exceed RAM Total.
-        "oid": "1.3.6.1.4.1.2021.4.6.0",
-        "unit": "MiB",
-        "icon": "mdi:memory",
-        "device_class": None,
-        "state_class": "measurement",
-        "transform": "kb_to_mib",
-    },
-    {
-        "key": "ram_used",
-        "name": "RAM Used",
+        oid="1.3.6.1.4.1.2021.4.6.0",
+        unit="MiB",
+        icon="mdi:memory",
+        device_class=None,
+        state_class="measurement",
+        parser="kb_to_mib",
+    ),
+    SensorSpec(
+        key="ram_used",
+        name="RAM Used",
         # No direct OID for used physical RAM in UCD-SNMP-MIB.
         # Computed as ram_total - ram_free in snmp_helper.fetch_snmp_data.
-        "oid": None,
-        "computed": True,
-        "unit": "MiB",
-        "icon": "mdi:memory",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-    {
-        "key": "system_temperature",
-        "name": "System Temperature",
-        "oid": WD_OID_SYSTEM_TEMP,
-        "unit": "°C",
-        "icon": "mdi:thermometer",
-        "device_class": "temperature",
-        "state_class": "measurement",
-    },
-    {
-        "key": "fan_status",
-        "name": "Fan Status",
-        "oid": WD_OID_FAN_STATUS,
-        "unit": "",
-        "icon": "mdi:fan",
-        "device_class": None,
-        "state_class": None,
-    },
-    {
+        oid=None,
+        computed=True,
+        unit="MiB",
+        icon="mdi:memory",
+        device_class=None,
+        state_class="measurement",
+    ),
+    SensorSpec(
+        key="system_temperature",
+        name="System Temperature",
+        oid=WD_OID_SYSTEM_TEMP,
+        parser="temperature",
+        unit="°C",
+        icon="mdi:thermometer",
+        device_class="temperature",
+        state_class="measurement",
+    ),
+    SensorSpec(
+        key="fan_status",
+        name="Fan Status",
+        oid=WD_OID_FAN_STATUS,
+        unit="",
+        icon="mdi:fan",
+        device_class=None,
+        state_class=None,
+    ),
+    SensorSpec(
         # 64-bit counter – replaces old 32-bit ifInOctets (wraps at ~4 GB)
-        "key": "network_in",
-        "name": "Network In (eth0)",
-        "oid": IF_HC_IN_OCTETS_ETH0,
-        "unit": "B",
-        "icon": "mdi:download-network",
-        "device_class": "data_size",
-        "state_class": "total_increasing",
-    },
-    {
+        key="network_in",
+        name="Network In (eth0)",
+        oid=IF_HC_IN_OCTETS_ETH0,
+        unit="B",
+        icon="mdi:download-network",
+        device_class="data_size",
+        state_class="total_increasing",
+    ),
+    SensorSpec(
         # 64-bit counter – replaces old 32-bit ifOutOctets (wraps at ~4 GB)
-        "key": "network_out",
-        "name": "Network Out (eth0)",
-        "oid": IF_HC_OUT_OCTETS_ETH0,
-        "unit": "B",
-        "icon": "mdi:upload-network",
-        "device_class": "data_size",
-        "state_class": "total_increasing",
-    },
-    {
-        "key": "system_uptime",
-        "name": "System Uptime",
-        "oid": "1.3.6.1.2.1.1.3.0",
-        "unit": "s",
-        "icon": "mdi:timer-outline",
-        "device_class": None,
-        "state_class": "measurement",
-    },
-]
+        key="network_out",
+        name="Network Out (eth0)",
+        oid=IF_HC_OUT_OCTETS_ETH0,
+        unit="B",
+        icon="mdi:upload-network",
+        device_class="data_size",
+        state_class="total_increasing",
+    ),
+    SensorSpec(
+        key="system_uptime",
+        name="System Uptime",
+        oid="1.3.6.1.2.1.1.3.0",
+        parser="timeticks",
+        unit="s",
+        icon="mdi:timer-outline",
+        device_class=None,
+        state_class="measurement",
+    ),
+)
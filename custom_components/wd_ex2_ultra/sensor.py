@@ -2,23 +2,126 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, SENSORS, CONF_HOST
+from .const import DOMAIN, SENSORS, CONF_HOST, SensorSpec
 from . import WDEx2UltraCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# SensorSpec.device_class / state_class names -> Home Assistant enums
+_DEVICE_CLASS_MAP = {
+    "temperature": SensorDeviceClass.TEMPERATURE,
+    "data_size": SensorDeviceClass.DATA_SIZE,
+}
+_STATE_CLASS_MAP = {
+    "measurement": SensorStateClass.MEASUREMENT,
+    "total_increasing": SensorStateClass.TOTAL_INCREASING,
+}
+
+
+@dataclass(frozen=True, kw_only=True)
+class WDTableSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor created for every disk or volume table row.
+
+    name is appended to the row label (e.g. "Disk 1" or the volume name);
+    show_model adds the disk model to the label.
+    """
+
+    show_model: bool = False
+
+
+# key is the field of the disk dict built by snmp_helper.fetch_disk_table
+DISK_SENSORS: tuple[WDTableSensorEntityDescription, ...] = (
+    WDTableSensorEntityDescription(
+        key="temperature",
+        name="Temperature",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        state_class=SensorStateClass.MEASUREMENT,
+        show_model=True,
+    ),
+    WDTableSensorEntityDescription(
+        key="capacity",
+        name="Capacity",
+        native_unit_of_measurement="GB",
+        icon="mdi:harddisk",
+        state_class=SensorStateClass.MEASUREMENT,
+        show_model=True,
+    ),
+    WDTableSensorEntityDescription(
+        key="status",
+        name="Health",
+        icon="mdi:harddisk",
+        show_model=True,
+    ),
+    WDTableSensorEntityDescription(
+        key="model",
+        name="Model",
+        icon="mdi:information-outline",
+    ),
+    WDTableSensorEntityDescription(
+        key="vendor",
+        name="Vendor",
+        icon="mdi:information-outline",
+    ),
+)
+
+# key is the field of the volume dict built by snmp_helper.fetch_volume_table;
+# used_mb and used_pct arrive unrounded; suggested_display_precision
+# rounds them for display.
+VOLUME_SENSORS: tuple[WDTableSensorEntityDescription, ...] = (
+    WDTableSensorEntityDescription(
+        key="size_mb",
+        name="Total Size",
+        native_unit_of_measurement="MB",
+        icon="mdi:nas",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WDTableSensorEntityDescription(
+        key="free_mb",
+        name="Free Space",
+        native_unit_of_measurement="MB",
+        icon="mdi:nas",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    WDTableSensorEntityDescription(
+        key="used_mb",
+        name="Used Space",
+        native_unit_of_measurement="MB",
+        icon="mdi:nas",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+    ),
+    WDTableSensorEntityDescription(
+        key="used_pct",
+        name="Used Percent",
+        native_unit_of_measurement="%",
+        icon="mdi:chart-pie",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+    ),
+    WDTableSensorEntityDescription(
+        key="raid_level",
+        name="RAID Level",
+        icon="mdi:shield-half-full",
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,220 +131,120 @@ async def async_setup_entry(
     """Set up sensors from config entry."""
     coordinator: WDEx2UltraCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-
-    # Static scalar sensors
-    for sensor in SENSORS:
-        entities.append(WDEx2UltraSensor(coordinator, entry, sensor))
-
-    async_add_entities(entities)
-
     # -------------------------------------------------------------------
     # Dynamic disk and volume sensors.
-    # The coordinator may not yet have data at setup time (e.g. on the
-    # very first poll), so we register a one-shot listener that adds the
-    # dynamic entities as soon as the first successful update arrives.
-    # Subsequent updates are handled by CoordinatorEntity automatically.
+    # async_setup_entry in __init__.py runs the first refresh before the
+    # platform is set up, so the disks and volumes known at that point are
+    # added together with the static sensors. A coordinator listener adds
+    # entities for rows reported later by an inventory refresh (new disks
+    # or volumes); updates without new rows return right away.
+    # Values are updated by CoordinatorEntity automatically.
     # -------------------------------------------------------------------
     added_disk_indices: set[str] = set()
     added_volume_indices: set[str] = set()
 
-    def _add_dynamic_entities() -> None:
-        """Add disk and volume entities for newly discovered indices."""
-        if coordinator.data is None:
-            return
+    def _new_table_entities() -> list[SensorEntity]:
+        """Create disk and volume entities for newly discovered indices."""
+        data = coordinator.data
+        if data is None:
+            return []
 
         new_entities: list[SensorEntity] = []
-
-        # --- Disk sensors ---
-        disks = coordinator.data.get("_disks", [])
-        for disk in disks:
-            idx = disk["index"]
-            if idx in added_disk_indices:
-                continue
-            added_disk_indices.add(idx)
-
-            model = disk.get("model", "").strip()
-            label = f"Disk {idx}" + (f" ({model})" if model else "")
-
-            new_entities.append(
-                WDEx2UltraDiskSensor(
-                    coordinator, entry, idx, "temperature",
-                    name=f"{label} Temperature",
-                    unit="°C",
-                    icon="mdi:thermometer",
-                    device_class=SensorDeviceClass.TEMPERATURE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraDiskSensor(
-                    coordinator, entry, idx, "capacity",
-                    name=f"{label} Capacity",
-                    unit="GB",
-                    icon="mdi:harddisk",
-                    device_class=None,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraDiskSensor(
-                    coordinator, entry, idx, "status",
-                    name=f"{label} Health",
-                    unit=None,
-                    icon="mdi:harddisk",
-                    device_class=None,
-                    state_class=None,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraDiskSensor(
-                    coordinator, entry, idx, "model",
-                    name=f"Disk {idx} Model",
-                    unit=None,
-                    icon="mdi:information-outline",
-                    device_class=None,
-                    state_class=None,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraDiskSensor(
-                    coordinator, entry, idx, "vendor",
-                    name=f"Disk {idx} Vendor",
-                    unit=None,
-                    icon="mdi:information-outline",
-                    device_class=None,
-                    state_class=None,
-                )
-            )
-
-        # --- Volume / RAID sensors ---
-        volumes = coordinator.data.get("_volumes", [])
-        for vol in volumes:
-            vidx = vol["index"]
-            if vidx in added_volume_indices:
-                continue
-            added_volume_indices.add(vidx)
-
-            vol_name = vol.get("name", "").strip() or f"Volume {vidx}"
-
-            new_entities.append(
-                WDEx2UltraVolumeSensor(
-                    coordinator, entry, vidx, "size_mb",
-                    name=f"{vol_name} Total Size",
-                    unit="MB",
-                    icon="mdi:nas",
-                    device_class=None,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraVolumeSensor(
-                    coordinator, entry, vidx, "free_mb",
-                    name=f"{vol_name} Free Space",
-                    unit="MB",
-                    icon="mdi:nas",
-                    device_class=None,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraVolumeSensor(
-                    coordinator, entry, vidx, "used_mb",
-                    name=f"{vol_name} Used Space",
-                    unit="MB",
-                    icon="mdi:nas",
-                    device_class=None,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraVolumeSensor(
-                    coordinator, entry, vidx, "used_pct",
-                    name=f"{vol_name} Used Percent",
-                    unit="%",
-                    icon="mdi:chart-pie",
-                    device_class=None,
-                    state_class=SensorStateClass.MEASUREMENT,
-                )
-            )
-            new_entities.append(
-                WDEx2UltraVolumeSensor(
-                    coordinator, entry, vidx, "raid_level",
-                    name=f"{vol_name} RAID Level",
-                    unit=None,
-                    icon="mdi:shield-half-full",
-                    device_class=None,
-                    state_class=None,
+        # Rows only change when the inventory is refreshed, so on most
+        # updates both differences are empty and no entity is built.
+        for rows_by_index, added_indices, entity_cls, descriptions in (
+            (data["_disks_by_index"], added_disk_indices, WDEx2UltraDiskSensor, DISK_SENSORS),
+            (data["_volumes_by_index"], added_volume_indices, WDEx2UltraVolumeSensor, VOLUME_SENSORS),
+        ):
+            new_indices = rows_by_index.keys() - added_indices
+            for idx in new_indices:
+                row = rows_by_index[idx]
+                new_entities.extend(
+                    entity_cls(coordinator, entry, idx, row, description)
+                    for description in descriptions
                 )
-            )
+            added_indices.update(new_indices)
 
+        return new_entities
+
+    def _add_dynamic_entities() -> None:
+        """Add entities for disks and volumes that appeared after setup."""
+        new_entities = _new_table_entities()
         if new_entities:
             async_add_entities(new_entities)
 
-    # Try to add entities immediately if data is already available
-    _add_dynamic_entities()
+    # Static scalar sensors plus the table rows known now, in one batch
+    entities: list[SensorEntity] = [
+        WDEx2UltraSensor(coordinator, entry, sensor) for sensor in SENSORS
+    ]
+    entities.extend(_new_table_entities())
+    async_add_entities(entities)
 
-    # Also register as a coordinator listener so entities are added after
-    # the first update if coordinator.data was None during setup.
     entry.async_on_unload(
         coordinator.async_add_listener(_add_dynamic_entities)
     )
 
 
-class WDEx2UltraSensor(CoordinatorEntity, SensorEntity):
+def _device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device info shared by all sensors of a config entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"WD MyCloud EX2 Ultra ({entry.data[CONF_HOST]})",
+        manufacturer="Western Digital",
+        model="MyCloud EX2 Ultra",
+    )
+
+
+class _WDEx2UltraCoordinatorSensor(CoordinatorEntity, SensorEntity):
+    """Base for sensors whose value comes from the coordinator data.
+
+    The value is looked up once per coordinator update and kept in
+    _attr_native_value, so state reads do not walk the data dicts.
+    """
+
+    # Key of the value in the coordinator data
+    _key: str
+
+    def _lookup_value(self, data: dict):
+        """Return the sensor value from the coordinator data."""
+        return data.get(self._key)
+
+    def _refresh_value(self) -> None:
+        """Store the value for the current coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = self._lookup_value(data) if data is not None else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Store the new value, then write the state."""
+        self._refresh_value()
+        super()._handle_coordinator_update()
+
+
+class WDEx2UltraSensor(_WDEx2UltraCoordinatorSensor):
     """Representation of a static WD EX2 Ultra sensor (scalar OID)."""
 
     def __init__(
         self,
         coordinator: WDEx2UltraCoordinator,
         entry: ConfigEntry,
-        sensor_def: dict,
+        sensor_def: SensorSpec,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._sensor_def = sensor_def
-        self._entry = entry
-        self._attr_unique_id = f"{entry.entry_id}_{sensor_def['key']}"
-        self._attr_name = sensor_def["name"]
-        self._attr_native_unit_of_measurement = sensor_def["unit"] or None
-        self._attr_icon = sensor_def.get("icon")
-
-        device_class = sensor_def.get("device_class")
-        if device_class == "temperature":
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        elif device_class == "data_size":
-            self._attr_device_class = SensorDeviceClass.DATA_SIZE
-        else:
-            self._attr_device_class = None
-
-        state_class = sensor_def.get("state_class")
-        if state_class == "measurement":
-            self._attr_state_class = SensorStateClass.MEASUREMENT
-        elif state_class == "total_increasing":
-            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
-        else:
-            self._attr_state_class = None
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"WD MyCloud EX2 Ultra ({self._entry.data[CONF_HOST]})",
-            manufacturer="Western Digital",
-            model="MyCloud EX2 Ultra",
-        )
-
-    @property
-    def native_value(self):
-        """Return the current sensor value."""
-        if self.coordinator.data is None:
-            return None
-        return self.coordinator.data.get(self._sensor_def["key"])
-
-
-class WDEx2UltraDiskSensor(CoordinatorEntity, SensorEntity):
+        self._key = sensor_def.key
+        self._attr_device_info = _device_info(entry)
+        self._attr_unique_id = f"{entry.entry_id}_{sensor_def.key}"
+        self._attr_name = sensor_def.name
+        self._attr_native_unit_of_measurement = sensor_def.unit or None
+        self._attr_icon = sensor_def.icon
+
+        self._attr_device_class = _DEVICE_CLASS_MAP.get(sensor_def.device_class)
+        self._attr_state_class = _STATE_CLASS_MAP.get(sensor_def.state_class)
+        self._refresh_value()
+
+
+class WDEx2UltraDiskSensor(_WDEx2UltraCoordinatorSensor):
     """Representation of a dynamic WD disk table sensor."""
 
     def __init__(
@@ -249,48 +252,30 @@ class WDEx2UltraDiskSensor(CoordinatorEntity, SensorEntity):
         coordinator: WDEx2UltraCoordinator,
         entry: ConfigEntry,
         disk_index: str,
-        metric: str,
-        name: str,
-        unit: str | None,
-        icon: str,
-        device_class: SensorDeviceClass | None,
-        state_class: SensorStateClass | None,
+        disk: dict,
+        description: WDTableSensorEntityDescription,
     ) -> None:
         """Initialize the disk sensor."""
         super().__init__(coordinator)
-        self._entry = entry
+        label = f"Disk {disk_index}"
+        model = disk.get("model", "").strip()
+        if description.show_model and model:
+            label += f" ({model})"
+        self._attr_device_info = _device_info(entry)
+        self.entity_description = description
         self._disk_index = disk_index
-        self._metric = metric
-        self._attr_unique_id = f"{entry.entry_id}_disk_{disk_index}_{metric}"
-        self._attr_name = name
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"WD MyCloud EX2 Ultra ({self._entry.data[CONF_HOST]})",
-            manufacturer="Western Digital",
-            model="MyCloud EX2 Ultra",
-        )
-
-    @property
-    def native_value(self):
-        """Return the current value from the disk table."""
-        if self.coordinator.data is None:
-            return None
-        disks: list[dict] = self.coordinator.data.get("_disks", [])
-        for disk in disks:
-            if disk["index"] == self._disk_index:
-                return disk.get(self._metric)
-        return None
-
-
-class WDEx2UltraVolumeSensor(CoordinatorEntity, SensorEntity):
+        self._metric = description.key
+        self._attr_unique_id = f"{entry.entry_id}_disk_{disk_index}_{description.key}"
+        self._attr_name = f"{label} {description.name}"
+        self._refresh_value()
+
+    def _lookup_value(self, data: dict):
+        """Return the value from the disk table."""
+        disk = data["_disks_by_index"].get(self._disk_index)
+        return disk.get(self._metric) if disk is not None else None
+
+
+class WDEx2UltraVolumeSensor(_WDEx2UltraCoordinatorSensor):
     """Representation of a dynamic WD volume/RAID table sensor."""
 
     def __init__(
@@ -298,42 +283,21 @@ class WDEx2UltraVolumeSensor(CoordinatorEntity, SensorEntity):
         coordinator: WDEx2UltraCoordinator,
         entry: ConfigEntry,
         volume_index: str,
-        metric: str,
-        name: str,
-        unit: str | None,
-        icon: str,
-        device_class: SensorDeviceClass | None,
-        state_class: SensorStateClass | None,
+        volume: dict,
+        description: WDTableSensorEntityDescription,
     ) -> None:
         """Initialize the volume sensor."""
         super().__init__(coordinator)
-        self._entry = entry
+        label = volume.get("name", "").strip() or f"Volume {volume_index}"
+        self._attr_device_info = _device_info(entry)
+        self.entity_description = description
         self._volume_index = volume_index
-        self._metric = metric
-        self._attr_unique_id = f"{entry.entry_id}_volume_{volume_index}_{metric}"
-        self._attr_name = name
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_device_class = device_class
-        self._attr_state_class = state_class
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"WD MyCloud EX2 Ultra ({self._entry.data[CONF_HOST]})",
-            manufacturer="Western Digital",
-            model="MyCloud EX2 Ultra",
-        )
-
-    @property
-    def native_value(self):
-        """Return the current value from the volume table."""
-        if self.coordinator.data is None:
-            return None
-        volumes: list[dict] = self.coordinator.data.get("_volumes", [])
-        for vol in volumes:
-            if vol["index"] == self._volume_index:
-                return vol.get(self._metric)
-        return None
+        self._metric = description.key
+        self._attr_unique_id = f"{entry.entry_id}_volume_{volume_index}_{description.key}"
+        self._attr_name = f"{label} {description.name}"
+        self._refresh_value()
+
+    def _lookup_value(self, data: dict):
+        """Return the value from the volume table."""
+        volume = data["_volumes_by_index"].get(self._volume_index)
+        return volume.get(self._metric) if volume is not None else None
@@ -6,13 +6,94 @@ SNMP integration (pysnmp==7.1.22).
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import math
 import re
+import sys
+from dataclasses import dataclass, field
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .const import (
+    CONF_AUTH_PASSWORD,
+    CONF_AUTH_PROTOCOL,
+    CONF_COMMUNITY,
+    CONF_PRIV_PASSWORD,
+    CONF_PRIV_PROTOCOL,
+    CONF_SNMP_VERSION,
+    CONF_USERNAME,
+    DISK_STATUS_MAP,
+    RAID_LEVEL_MAP,
+    SNMP_RETRIES,
+    SNMP_TIMEOUT,
+    SNMP_VERSION_V2C,
+    WD_DISK_COL_CAPACITY,
+    WD_DISK_COL_MODEL,
+    WD_DISK_COL_SERIAL,
+    WD_DISK_COL_STATUS,
+    WD_DISK_COL_TEMPERATURE,
+    WD_DISK_COL_VENDOR,
+    WD_VOL_COL_FREESPACE,
+    WD_VOL_COL_FSTYPE,
+    WD_VOL_COL_NAME,
+    WD_VOL_COL_RAIDLEVEL,
+    WD_VOL_COL_SIZE,
+)
+
+try:
+    from pyasn1.error import PyAsn1Error
+    from pyasn1.type.univ import Integer, OctetString
+    from pysnmp.error import PySnmpError
+    from pysnmp.hlapi.v3arch.asyncio import (
+        CommunityData,
+        ContextData,
+        EndOfMibView,
+        NoSuchInstance,
+        NoSuchObject,
+        ObjectIdentity,
+        ObjectType,
+        SnmpEngine,
+        UdpTransportTarget,
+        UsmUserData,
+        bulk_cmd,
+        get_cmd,
+        usmAesCfb128Protocol,
+        usmDESPrivProtocol,
+        usmHMACMD5AuthProtocol,
+        usmHMACSHAAuthProtocol,
+    )
+except ImportError as err:
+    # Keep the module importable so the config flow can report the problem;
+    # the original error is chained to SnmpLibraryMissing for the log
+    _PYSNMP_IMPORT_ERROR: ImportError | None = err
+else:
+    _PYSNMP_IMPORT_ERROR = None
+    # Default SNMP context (empty engine ID and name); immutable, so shared
+    _CONTEXT = ContextData()
+    # What a failing pysnmp request can raise; anything else is a bug and
+    # propagates to the coordinator
+    _SNMP_ERRORS = (OSError, PyAsn1Error, PySnmpError)
+    # SNMPv3 protocol names offered by the config flow
+    _AUTH_PROTOS = {
+        "MD5": usmHMACMD5AuthProtocol,
+        "SHA": usmHMACSHAAuthProtocol,
+    }
+    _PRIV_PROTOS = {
+        "DES": usmDESPrivProtocol,
+        "AES": usmAesCfb128Protocol,
+    }
+
 _LOGGER = logging.getLogger(__name__)
 
+# Largest number of varbinds sent in one GET PDU; keeps responses for many
+# disks/volumes well below the EX2 Ultra's tooBig limit.
+MAX_GET_VARBINDS = 20
+
+_CENTIGRADE_RE = re.compile(r'Centigrade:\s*(\d+)')
+_WHITESPACE_TABLE = str.maketrans('', '', ' \t\n\r\x0b\x0c')
+_NON_NUMERIC_RE = re.compile(r'[^0-9.\-]')
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect to the device."""
@@ -26,134 +107,187 @@ class SnmpLibraryMissing(HomeAssistantError):
     """Error to indicate pysnmp is not installed or incompatible."""
 
 
+@dataclass(slots=True)
+class SnmpSession:
+    """pysnmp objects shared by every request to one device.
+
+    Built once by open_snmp_session(); target is filled in (and replaced on
+    re-resolution) with create_transport_target(). reported_missing holds the
+    sensor keys already warned about as unavailable on the device.
+    """
+
+    engine: SnmpEngine
+    auth_data: CommunityData | UsmUserData
+    target: UdpTransportTarget | None = None
+    reported_missing: set[str] = field(default_factory=set)
+
+
+def _require_pysnmp() -> None:
+    """Raise SnmpLibraryMissing if pysnmp could not be imported."""
+    if _PYSNMP_IMPORT_ERROR is not None:
+        raise SnmpLibraryMissing(
+            "pysnmp 7.1.22 is not installed. Restart Home Assistant."
+        ) from _PYSNMP_IMPORT_ERROR
+
+
 def sanitize_host(host: str) -> str:
     """Strip http://, https://, trailing slashes and whitespace."""
     host = host.strip()
-    host = re.sub(r'^https?://', '', host)
-    host = host.rstrip('/')
-    return host
+    # URL schemes are case-insensitive ("HTTP://nas.local" is valid too)
+    scheme = host[:8].lower()
+    if scheme == "https://":
+        host = host[8:]
+    elif scheme.startswith("http://"):
+        host = host[7:]
+    return host.rstrip('/')
 
 
-def parse_snmp_number(raw_value: str) -> float | None:
-    """Safely parse a numeric string from SNMP, ignoring locale separators."""
+def parse_snmp_number(raw_value: str | int) -> float | None:
+    """Safely parse a numeric string from SNMP, ignoring locale separators.
+
+    Integers (already decoded from numeric SNMP types) and strings float()
+    accepts as-is are returned without going through the string cleanup.
+    """
     if raw_value is None:
         return None
-    s = str(raw_value).strip()
+    if isinstance(raw_value, int):
+        return float(raw_value)
+    s = raw_value if isinstance(raw_value, str) else str(raw_value)
+    try:
+        value = float(s)
+    except ValueError:
+        pass
+    else:
+        # 'nan' / 'inf' are not numbers the NAS reports; let the cleanup
+        # below reject them as before
+        if math.isfinite(value):
+            return value
     # Remove thousands separators (dot or space) and normalise decimal comma
-    s = re.sub(r'[\s]', '', s)          # remove spaces
+    s = s.translate(_WHITESPACE_TABLE)  # remove spaces
     # If both '.' and ',' exist, treat '.' as thousands sep
     if '.' in s and ',' in s:
         s = s.replace('.', '').replace(',', '.')
     elif ',' in s:
         s = s.replace(',', '.')
     # Remove any remaining non-numeric chars except leading minus and dot
-    s = re.sub(r'[^0-9.\-]', '', s)
+    s = _NON_NUMERIC_RE.sub('', s)
     try:
         return float(s)
     except (ValueError, TypeError):
         return None
 
 
-def parse_wd_temperature(raw_value: str) -> float | None:
+# Pure and fed from a small set of readings (a few dozen temperatures), so
+# after the first polls every call is a cache hit
+@functools.lru_cache(maxsize=128)
+def parse_wd_temperature(raw_value: str | int) -> float | None:
     """Parse WD temperature string 'Centigrade:48 Fahrenheit:118' to float.
 
-    Also handles plain numeric strings returned by the WD MIB disk table.
+    Also handles plain numeric strings returned by the WD MIB disk table and
+    integers decoded from numeric SNMP types.
     """
+    if isinstance(raw_value, int):
+        return float(raw_value)
     if not raw_value or not isinstance(raw_value, str):
         return None
-    match_c = re.search(r'Centigrade:\s*(\d+)', raw_value)
-    if match_c:
-        try:
-            return float(match_c.group(1))
-        except (ValueError, AttributeError):
-            pass
+    stripped = raw_value.strip()
+    if stripped.isdecimal():
+        return float(stripped)
+    if "Centigrade:" in stripped:
+        # Use the Centigrade field wherever it sits; the generic number
+        # parser would join the digits of both fields into one value.
+        match_c = _CENTIGRADE_RE.search(stripped)
+        return float(match_c.group(1)) if match_c else None
     return parse_snmp_number(raw_value)
 
 
+def _value_text(value) -> str:
+    """Return an SNMP value as text.
+
+    OctetStrings are decoded straight from their bytes as UTF-8, with
+    undecodable bytes replaced. str() would decode them as ISO-8859-1 and
+    garble non-ASCII volume names.
+    """
+    if isinstance(value, OctetString):
+        return value.asOctets().decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _parse_number(raw_value: str | int):
+    """Parse a numeric value, falling back to the raw string (e.g. fan status)."""
+    parsed = parse_snmp_number(raw_value)
+    return parsed if parsed is not None else raw_value
+
+
+def _parse_timeticks(raw_value: str | int) -> float | None:
+    """Convert TimeTicks (hundredths of a second) to seconds."""
+    parsed = parse_snmp_number(raw_value)
+    return round(parsed / 100, 1) if parsed is not None else None
+
+
+def _parse_kb_to_mib(raw_value: str | int) -> float | None:
+    """Convert a UCD-SNMP-MIB kB value to MiB."""
+    parsed = parse_snmp_number(raw_value)
+    return round(parsed / 1024, 1) if parsed is not None else None
+
+
+# Value parsers selected by SensorSpec.parser
+_PARSERS = {
+    "number": _parse_number,
+    "timeticks": _parse_timeticks,
+    "kb_to_mib": _parse_kb_to_mib,
+    "temperature": parse_wd_temperature,
+}
+
+
 def _build_auth_data(data: dict):
     """Build pysnmp auth data based on SNMP version (sync helper)."""
-    try:
-        from pysnmp.hlapi.v3arch.asyncio import (
-            CommunityData,
-            UsmUserData,
-            usmHMACMD5AuthProtocol,
-            usmHMACSHAAuthProtocol,
-            usmDESPrivProtocol,
-            usmAesCfb128Protocol,
-        )
-    except ImportError as err:
-        raise SnmpLibraryMissing(
-            "pysnmp 7.1.22 is not installed. Restart Home Assistant after HACS installation."
-        ) from err
-
-    from .const import (
-        CONF_SNMP_VERSION,
-        CONF_COMMUNITY,
-        CONF_USERNAME,
-        CONF_AUTH_PROTOCOL,
-        CONF_AUTH_PASSWORD,
-        CONF_PRIV_PROTOCOL,
-        CONF_PRIV_PASSWORD,
-        SNMP_VERSION_V2C,
-    )
+    _require_pysnmp()
 
     snmp_version = data.get(CONF_SNMP_VERSION, SNMP_VERSION_V2C)
 
     if snmp_version == SNMP_VERSION_V2C:
         return CommunityData(data.get(CONF_COMMUNITY, "public"), mpModel=1)
 
-    auth_protocol_map = {
-        "MD5": usmHMACMD5AuthProtocol,
-        "SHA": usmHMACSHAAuthProtocol,
-    }
-    priv_protocol_map = {
-        "DES": usmDESPrivProtocol,
-        "AES": usmAesCfb128Protocol,
-    }
     return UsmUserData(
         data[CONF_USERNAME],
         authKey=data[CONF_AUTH_PASSWORD],
         privKey=data[CONF_PRIV_PASSWORD],
-        authProtocol=auth_protocol_map.get(data[CONF_AUTH_PROTOCOL], usmHMACMD5AuthProtocol),
-        privProtocol=priv_protocol_map.get(data[CONF_PRIV_PROTOCOL], usmDESPrivProtocol),
+        authProtocol=_AUTH_PROTOS.get(data[CONF_AUTH_PROTOCOL], usmHMACMD5AuthProtocol),
+        privProtocol=_PRIV_PROTOS.get(data[CONF_PRIV_PROTOCOL], usmDESPrivProtocol),
     )
 
 
 async def test_snmp_connection(data: dict) -> None:
-    """Async SNMP connectivity test – queries sysUpTime (1.3.6.1.2.1.1.3.0)."""
-    try:
-        from pysnmp.hlapi.v3arch.asyncio import (
-            SnmpEngine,
-            ContextData,
-            UdpTransportTarget,
-            ObjectType,
-            ObjectIdentity,
-            get_cmd,
-        )
-    except ImportError as err:
-        raise SnmpLibraryMissing(
-            "pysnmp 7.1.22 is not installed. Restart Home Assistant."
-        ) from err
+    """Async SNMP connectivity test – queries sysUpTime (1.3.6.1.2.1.1.3.0).
 
+    Uses the same session and transport helpers as the coordinator, so the
+    config flow tests exactly what polling will later use.
+    """
+    _require_pysnmp()
+
+    session = None
     try:
-        host = sanitize_host(data["host"])
-        auth_data = _build_auth_data(data)
-        target = await UdpTransportTarget.create((host, 161), timeout=5, retries=1)
-        # SnmpEngine() reads MIB files from disk (blocking I/O) – run in executor
-        engine = await asyncio.get_running_loop().run_in_executor(None, SnmpEngine)
+        target = await create_transport_target(data["host"])
+        session = await open_snmp_session(data)
+        session.target = target
 
         error_indication, error_status, error_index, _ = await get_cmd(
-            engine,
-            auth_data,
-            target,
-            ContextData(),
+            session.engine,
+            session.auth_data,
+            session.target,
+            _CONTEXT,
             ObjectType(ObjectIdentity("1.3.6.1.2.1.1.3.0")),
+            lookupMib=False,
         )
     except SnmpLibraryMissing:
         raise
     except Exception as err:
         _LOGGER.exception("Unexpected error during SNMP test: %s", err)
         raise CannotConnect(str(err)) from err
+    finally:
+        if session is not None:
+            close_snmp_session(session)
 
     if error_indication:
         _LOGGER.error("SNMP test error_indication: %s", error_indication)
@@ -163,242 +297,472 @@ async def test_snmp_connection(data: dict) -> None:
         raise InvalidAuth(str(error_status))
 
 
-async def walk_snmp_column(data: dict, column_oid: str) -> dict[str, str]:
-    """Walk a single SNMP table column and return {row_index: value} dict.
+async def open_snmp_session(data: dict) -> SnmpSession:
+    """Create the SnmpSession (engine and auth data) for polling one device.
 
-    The row index is extracted as the last OID component after column_oid.
-    Uses an iterative GETNEXT loop because next_cmd() is a coroutine in
-    pysnmp 7.x, not an async generator – 'async for' cannot be used with it.
+    The coordinator keeps the session for its whole lifetime, so the
+    expensive SnmpEngine set-up and the auth data are built once instead of
+    on every poll. The transport target is set by the caller.
     """
-    try:
-        from pysnmp.hlapi.v3arch.asyncio import (
-            SnmpEngine,
-            ContextData,
-            UdpTransportTarget,
-            ObjectType,
-            ObjectIdentity,
-            next_cmd,
-        )
-    except ImportError as err:
-        raise SnmpLibraryMissing(
-            "pysnmp 7.1.22 is not installed. Restart Home Assistant."
-        ) from err
+    _require_pysnmp()
 
-    host = sanitize_host(data["host"])
     auth_data = _build_auth_data(data)
-    target = await UdpTransportTarget.create((host, 161), timeout=5, retries=1)
     # SnmpEngine() reads MIB files from disk (blocking I/O) – run in executor
     engine = await asyncio.get_running_loop().run_in_executor(None, SnmpEngine)
-    result: dict[str, str] = {}
+    return SnmpSession(engine, auth_data)
+
+
+async def create_transport_target(
+    host: str, timeout: float = SNMP_TIMEOUT, retries: int = SNMP_RETRIES
+):
+    """Resolve host and create the UDP transport target for it.
+
+    UdpTransportTarget.create() resolves the host name once and stores the
+    address, so a cached target never triggers a DNS lookup on later polls.
+    timeout (seconds) and retries apply to every request sent to it.
+    """
+    _require_pysnmp()
+
+    return await UdpTransportTarget.create(
+        (sanitize_host(host), 161), timeout=timeout, retries=retries
+    )
+
 
-    current_oid = column_oid
+def close_snmp_session(session: SnmpSession) -> None:
+    """Release the transport dispatcher (UDP socket) owned by the session."""
+    session.engine.close_dispatcher()
 
-    while True:
+
+def build_scalar_requests(sensors: tuple) -> list[tuple]:
+    """Build (key, parser, ObjectType) for every SNMP-backed sensor.
+
+    Computed sensors are skipped. The result is meant to be built once and
+    reused for every poll, so pysnmp resolves each OID only the first time
+    and the value parser is looked up only once per sensor.
+    """
+    _require_pysnmp()
+
+    return [
+        (
+            sensor.key,
+            _PARSERS[sensor.parser],
+            ObjectType(ObjectIdentity(sensor.oid)),
+        )
+        for sensor in sensors
+        if not sensor.computed
+    ]
+
+
+async def bulk_fetch_table(
+    session: SnmpSession,
+    column_roots: list[str],
+    max_repetitions: int = 10,
+) -> dict[str, dict[str, str]]:
+    """Walk several table columns with GETBULK.
+
+    Returns {column_root: {row_index: value}}. Every column that has not yet
+    run past its end is sent as a repeater of the same GETBULK PDU, so a small
+    table (a few disks or volumes) is usually retrieved in one round trip.
+    max_repetitions is kept at 10 – the EX2 Ultra answers larger bulk
+    requests with tooBig. A request that gets no response (timeout,
+    transport error) or an error status raises CannotConnect rather than
+    returning the rows read so far, so a cut-off walk is never mistaken for
+    the full table.
+    """
+    result: dict[str, dict[str, str]] = {root: {} for root in column_roots}
+    # Last OID seen per column that is still being walked
+    cursors: dict[str, str] = {root: root for root in column_roots}
+    # "<root>." and its length, built once instead of per varbind
+    prefixes: dict[str, tuple[str, int]] = {
+        root: (root + ".", len(root) + 1) for root in column_roots
+    }
+
+    while cursors:
+        roots = list(cursors)
         try:
-            error_indication, error_status, error_index, var_binds = await next_cmd(
-                engine,
-                auth_data,
-                target,
-                ContextData(),
-                ObjectType(ObjectIdentity(current_oid)),
+            error_indication, error_status, error_index, var_binds = await bulk_cmd(
+                session.engine,
+                session.auth_data,
+                session.target,
+                _CONTEXT,
+                0,
+                max_repetitions,
+                *[ObjectType(ObjectIdentity(cursors[root])) for root in roots],
+                lookupMib=False,
             )
-        except Exception as err:
-            _LOGGER.debug("Walk exception for OID %s: %s", current_oid, err)
-            break
+        except _SNMP_ERRORS as err:
+            raise CannotConnect(f"Bulk walk of {roots} failed: {err}") from err
 
         if error_indication or error_status:
-            _LOGGER.debug(
-                "Walk ended for OID %s: %s %s", column_oid, error_indication, error_status
+            raise CannotConnect(
+                f"Bulk walk of {roots} failed: {error_indication or error_status}"
             )
-            break
 
         if not var_binds:
             break
 
-        var_bind = var_binds[0]
-        oid_str = str(var_bind[0])
-        value_str = str(var_bind[1])
-
-        # Stop if the returned OID is outside this column
-        if not oid_str.startswith(column_oid + "."):
+        # The response holds up to max_repetitions groups with one successor
+        # per requested column, in request order.
+        finished: set[str] = set()
+        progressed = False
+        num_roots = len(roots)
+        for pos, var_bind in enumerate(var_binds):
+            root = roots[pos % num_roots]
+            if root in finished:
+                continue
+            oid_str = str(var_bind[0])
+            prefix, prefix_len = prefixes[root]
+            # Stop a column once the agent leaves it or runs out of MIB view
+            if isinstance(var_bind[1], EndOfMibView) or not oid_str.startswith(prefix):
+                finished.add(root)
+                continue
+            # Interned, so every inventory refresh yields the same index
+            # objects the entities already hold and lookups hit by identity
+            row_idx = sys.intern(oid_str[prefix_len:])
+            # Some agents repeat or step back to a row they already returned;
+            # end the column there instead of walking it in circles.
+            if row_idx in result[root]:
+                finished.add(root)
+                continue
+            result[root][row_idx] = _value_text(var_bind[1])
+            cursors[root] = oid_str
+            progressed = True
+
+        for root in finished:
+            del cursors[root]
+        if not progressed:
             break
 
-        row_idx = oid_str[len(column_oid) + 1:]
-        result[row_idx] = value_str
-        current_oid = oid_str  # advance to next OID for the following GETNEXT
-
     return result
 
 
-async def fetch_disk_table(data: dict) -> list[dict]:
-    """Fetch WD disk table dynamically. Returns list of disk dicts.
+async def _get_values(session: SnmpSession, object_types: list) -> list:
+    """GET object_types in PDUs of at most MAX_GET_VARBINDS varbinds each.
 
-    Each dict has keys: index, vendor, model, serial, temperature, capacity, status.
+    Returns one value per object type, in request order; a failed request
+    raises CannotConnect. If the agent rejects a PDU with an error status
+    (e.g. genErr caused by one OID), its OIDs are fetched one at a time and
+    the rejected ones come back as noSuchInstance; a rejected one-OID PDU
+    gives noSuchInstance directly. So do OIDs missing from a truncated
+    response.
     """
-    from .const import (
-        WD_DISK_COL_NUM,
+    values = []
+    for start in range(0, len(object_types), MAX_GET_VARBINDS):
+        chunk = object_types[start:start + MAX_GET_VARBINDS]
+        error_indication, error_status, error_index, var_binds = await get_cmd(
+            session.engine,
+            session.auth_data,
+            session.target,
+            _CONTEXT,
+            *chunk,
+            lookupMib=False,
+        )
+        if error_indication:
+            raise CannotConnect(str(error_indication))
+        if error_status and len(chunk) == 1:
+            values.append(NoSuchInstance(""))
+            continue
+        if error_status:
+            _LOGGER.debug(
+                "GET of %d OIDs failed with %s; retrying them one by one",
+                len(chunk),
+                error_status,
+            )
+            for object_type in chunk:
+                values.append(await _get_single_value(session, object_type))
+            continue
+        # Response varbinds come back in request order
+        values.extend(value for _, value in var_binds[:len(chunk)])
+        if len(var_binds) < len(chunk):
+            _LOGGER.debug(
+                "GET of %d OIDs returned only %d values",
+                len(chunk),
+                len(var_binds),
+            )
+            values.extend(NoSuchInstance("") for _ in chunk[len(var_binds):])
+    return values
+
+
+async def _get_single_value(session: SnmpSession, object_type):
+    """GET one OID; an error status or empty response is noSuchInstance."""
+    error_indication, error_status, error_index, var_binds = await get_cmd(
+        session.engine,
+        session.auth_data,
+        session.target,
+        _CONTEXT,
+        object_type,
+        lookupMib=False,
+    )
+    if error_indication:
+        raise CannotConnect(str(error_indication))
+    if error_status or not var_binds:
+        return NoSuchInstance("")
+    return var_binds[0][1]
+
+
+async def get_oid_values(session: SnmpSession, requests: list[tuple]) -> dict:
+    """GET a list of (key, ObjectType) pairs with as few PDUs as possible.
+
+    Returns {key: value string}. Keys whose OID does not exist on the device
+    are left out; a failed request raises CannotConnect.
+    """
+    if not requests:
+        return {}
+
+    values = await _get_values(session, [object_type for _, object_type in requests])
+    return {
+        key: _value_text(value)
+        for (key, _), value in zip(requests, values, strict=True)
+        if not isinstance(value, (NoSuchObject, NoSuchInstance, EndOfMibView))
+    }
+
+
+def _row_key(index: str) -> tuple:
+    """Sort key for table row indices: numeric indices first, in numeric order."""
+    return (0, int(index)) if index.isdigit() else (1, index)
+
+
+async def fetch_disk_inventory(session: SnmpSession) -> dict[str, dict]:
+    """Fetch the static WD disk table columns. Returns {index: disk dict}.
+
+    Each dict has keys: index, vendor, model, serial, capacity.
+    """
+    columns = await bulk_fetch_table(session, [
         WD_DISK_COL_VENDOR,
         WD_DISK_COL_MODEL,
         WD_DISK_COL_SERIAL,
-        WD_DISK_COL_TEMPERATURE,
         WD_DISK_COL_CAPACITY,
-        WD_DISK_COL_STATUS,
-        DISK_STATUS_MAP,
-    )
+    ])
 
-    # First walk the DiskNum column to find which indices exist
-    indices = await walk_snmp_column(data, WD_DISK_COL_NUM)
+    # Every disk row has a value in each column, so the union of the data
+    # columns gives the indices without walking the DiskNum column too
+    indices = set().union(*columns.values())
     if not indices:
         _LOGGER.debug("WD disk table: no disks found via SNMP walk")
-        return []
+        return {}
 
-    _LOGGER.debug("WD disk table indices found: %s", list(indices.keys()))
+    _LOGGER.debug("WD disk table indices found: %s", sorted(indices))
 
-    # Fetch remaining columns for each index
-    vendors    = await walk_snmp_column(data, WD_DISK_COL_VENDOR)
-    models     = await walk_snmp_column(data, WD_DISK_COL_MODEL)
-    serials    = await walk_snmp_column(data, WD_DISK_COL_SERIAL)
-    temps      = await walk_snmp_column(data, WD_DISK_COL_TEMPERATURE)
-    capacities = await walk_snmp_column(data, WD_DISK_COL_CAPACITY)
-    statuses   = await walk_snmp_column(data, WD_DISK_COL_STATUS)
+    vendors    = columns[WD_DISK_COL_VENDOR]
+    models     = columns[WD_DISK_COL_MODEL]
+    serials    = columns[WD_DISK_COL_SERIAL]
+    capacities = columns[WD_DISK_COL_CAPACITY]
+
+    inventory = {}
+    for idx in sorted(indices, key=_row_key):
+        inventory[idx] = {
+            "index":    idx,
+            "vendor":   vendors.get(idx, ""),
+            "model":    models.get(idx, ""),
+            "serial":   serials.get(idx, ""),
+            "capacity": parse_snmp_number(capacities.get(idx, "")),
+        }
+    return inventory
+
+
+async def fetch_disk_table(session: SnmpSession, inventory: dict) -> list[dict]:
+    """Fetch the changing WD disk columns and merge them into the inventory.
+
+    Reads temperature and status with one GET against the OIDs cached by
+    fetch_inventory(). Returns a list of disk dicts with keys: index,
+    vendor, model, serial, temperature, capacity, status.
+    """
+    if not inventory["disks"]:
+        return []
+
+    values = await get_oid_values(session, inventory["disk_oids"])
 
     disks = []
-    for idx in sorted(indices.keys(), key=lambda x: int(x) if x.isdigit() else x):
-        raw_status = statuses.get(idx, "0")
+    for idx, disk in inventory["disks"].items():
+        raw_status = values.get((idx, "status"), "0")
         disks.append({
-            "index":       idx,
-            "vendor":      vendors.get(idx, ""),
-            "model":       models.get(idx, ""),
-            "serial":      serials.get(idx, ""),
-            "temperature": parse_wd_temperature(temps.get(idx, "")),
-            "capacity":    parse_snmp_number(capacities.get(idx, "")),
+            **disk,
+            "temperature": parse_wd_temperature(values.get((idx, "temperature"), "")),
             "status":      DISK_STATUS_MAP.get(raw_status, raw_status),
         })
     return disks
 
 
-async def fetch_volume_table(data: dict) -> list[dict]:
-    """Fetch WD volume/RAID table dynamically. Returns list of volume dicts.
+async def fetch_volume_inventory(session: SnmpSession) -> dict[str, dict]:
+    """Fetch the static WD volume/RAID table columns. Returns {index: volume dict}.
 
-    Each dict has keys: index, name, fstype, raid_level, size_mb, free_mb,
-    used_mb, used_pct.
-    Size and free space are reported in MB by the WD MIB.
+    Each dict has keys: index, name, fstype, raid_level, size_mb.
+    Size is reported in MB by the WD MIB.
     """
-    from .const import (
-        WD_VOL_COL_NUM,
+    columns = await bulk_fetch_table(session, [
         WD_VOL_COL_NAME,
         WD_VOL_COL_FSTYPE,
         WD_VOL_COL_RAIDLEVEL,
         WD_VOL_COL_SIZE,
-        WD_VOL_COL_FREESPACE,
-        RAID_LEVEL_MAP,
-    )
+    ])
 
-    indices = await walk_snmp_column(data, WD_VOL_COL_NUM)
+    indices = set().union(*columns.values())
     if not indices:
         _LOGGER.debug("WD volume table: no volumes found via SNMP walk")
-        return []
+        return {}
+
+    _LOGGER.debug("WD volume table indices found: %s", sorted(indices))
+
+    names      = columns[WD_VOL_COL_NAME]
+    fstypes    = columns[WD_VOL_COL_FSTYPE]
+    raidlevels = columns[WD_VOL_COL_RAIDLEVEL]
+    sizes      = columns[WD_VOL_COL_SIZE]
+
+    inventory = {}
+    for idx in sorted(indices, key=_row_key):
+        raw_raid = raidlevels.get(idx, "")
+        inventory[idx] = {
+            "index":      idx,
+            "name":       names.get(idx, ""),
+            "fstype":     fstypes.get(idx, ""),
+            "raid_level": RAID_LEVEL_MAP.get(raw_raid, raw_raid),
+            "size_mb":    parse_snmp_number(sizes.get(idx, "")),
+        }
+    return inventory
+
 
-    _LOGGER.debug("WD volume table indices found: %s", list(indices.keys()))
+async def fetch_volume_table(session: SnmpSession, inventory: dict) -> list[dict]:
+    """Fetch the free space per volume and merge it into the inventory.
+
+    Reads free space with one GET against the OIDs cached by
+    fetch_inventory(). Returns a list of volume dicts with keys: index,
+    name, fstype, raid_level, size_mb, free_mb, used_mb, used_pct.
+    """
+    if not inventory["volumes"]:
+        return []
 
-    names      = await walk_snmp_column(data, WD_VOL_COL_NAME)
-    fstypes    = await walk_snmp_column(data, WD_VOL_COL_FSTYPE)
-    raidlevels = await walk_snmp_column(data, WD_VOL_COL_RAIDLEVEL)
-    sizes      = await walk_snmp_column(data, WD_VOL_COL_SIZE)
-    frees      = await walk_snmp_column(data, WD_VOL_COL_FREESPACE)
+    values = await get_oid_values(session, inventory["volume_oids"])
 
     volumes = []
-    for idx in sorted(indices.keys(), key=lambda x: int(x) if x.isdigit() else x):
-        size_mb = parse_snmp_number(sizes.get(idx, ""))
-        free_mb = parse_snmp_number(frees.get(idx, ""))
+    for idx, volume in inventory["volumes"].items():
+        size_mb = volume["size_mb"]
+        free_mb = parse_snmp_number(values.get(idx, ""))
         used_mb = None
         used_pct = None
+        # Left unrounded; the sensors' suggested_display_precision
+        # takes care of the display
         if size_mb is not None and free_mb is not None:
-            used_mb = round(size_mb - free_mb, 1)
+            used_mb = size_mb - free_mb
             if size_mb > 0:
-                used_pct = round((used_mb / size_mb) * 100, 1)
-        raw_raid = raidlevels.get(idx, "")
+                used_pct = used_mb * (100.0 / size_mb)
         volumes.append({
-            "index":      idx,
-            "name":       names.get(idx, ""),
-            "fstype":     fstypes.get(idx, ""),
-            "raid_level": RAID_LEVEL_MAP.get(raw_raid, raw_raid),
-            "size_mb":    size_mb,
-            "free_mb":    free_mb,
-            "used_mb":    used_mb,
-            "used_pct":   used_pct,
+            **volume,
+            "free_mb":  free_mb,
+            "used_mb":  used_mb,
+            "used_pct": used_pct,
         })
     return volumes
 
 
-async def fetch_snmp_data(data: dict, sensors: list) -> dict:
-    """Fetch all scalar sensor OIDs via SNMP. Returns dict keyed by sensor key.
+async def _await_all(coros: list, parallel: bool) -> list:
+    """Await coros concurrently or one after another.
 
-    Also fetches the WD disk table and volume table and adds their data to
-    the result under '_disks' and '_volumes' keys.
-    Sensors with 'computed: True' are skipped during the SNMP fetch and instead
-    derived from other already-fetched values.
+    Like asyncio.gather(..., return_exceptions=True): exceptions raised by
+    a coroutine are returned in its result slot.
     """
+    if parallel:
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    results = []
     try:
-        from pysnmp.hlapi.v3arch.asyncio import (
-            SnmpEngine,
-            ContextData,
-            UdpTransportTarget,
-            ObjectType,
-            ObjectIdentity,
-            get_cmd,
-        )
-    except ImportError as err:
-        raise SnmpLibraryMissing(
-            "pysnmp 7.1.22 is not installed. Restart Home Assistant."
-        ) from err
+        for coro in coros:
+            try:
+                results.append(await coro)
+            except Exception as err:
+                results.append(err)
+    finally:
+        # Cancelled part-way: don't leave the rest un-awaited
+        for coro in coros[len(results):]:
+            coro.close()
+    return results
+
+
+async def fetch_inventory(
+    session: SnmpSession, previous: dict, parallel: bool = True
+) -> tuple[dict, bool]:
+    """Walk the disk and volume tables and cache their row OIDs.
+
+    Returns (inventory, complete). inventory is {"disks": {index: dict},
+    "volumes": {index: dict}, "disk_oids": [...], "volume_oids": [...]}.
+    Disk model, vendor, serial and capacity and the volume layout only
+    change when hardware or volumes change, so the coordinator refreshes
+    this rarely. The *_oids lists hold pre-built (key, ObjectType) pairs for
+    the changing columns of the rows found, so fetch_disk_table() /
+    fetch_volume_table() can read them with a single GET instead of walking
+    the tables on every poll. With parallel the disk and volume tables are
+    walked concurrently.
+
+    A table whose walk fails keeps its rows and OIDs from previous, and
+    complete is False so the caller can retry on the next poll.
+    """
+    disks, volumes = await _await_all(
+        [fetch_disk_inventory(session), fetch_volume_inventory(session)],
+        parallel,
+    )
 
-    host = sanitize_host(data["host"])
-    auth_data = _build_auth_data(data)
-    target = await UdpTransportTarget.create((host, 161), timeout=5, retries=1)
-    # SnmpEngine() reads MIB files from disk (blocking I/O) – run in executor
-    engine = await asyncio.get_running_loop().run_in_executor(None, SnmpEngine)
-    result: dict = {}
+    inventory = dict(previous)
+    complete = True
+
+    if isinstance(disks, BaseException):
+        _LOGGER.warning("Could not walk WD disk table: %s", disks)
+        complete = False
+    else:
+        inventory["disks"] = disks
+        inventory["disk_oids"] = [
+            ((idx, column), ObjectType(ObjectIdentity(f"{root}.{idx}")))
+            for idx in disks
+            for column, root in (
+                ("temperature", WD_DISK_COL_TEMPERATURE),
+                ("status", WD_DISK_COL_STATUS),
+            )
+        ]
 
-    for sensor in sensors:
-        # Skip computed sensors – their values are derived below
-        if sensor.get("computed"):
-            continue
+    if isinstance(volumes, BaseException):
+        _LOGGER.warning("Could not walk WD volume table: %s", volumes)
+        complete = False
+    else:
+        inventory["volumes"] = volumes
+        inventory["volume_oids"] = [
+            (idx, ObjectType(ObjectIdentity(f"{WD_VOL_COL_FREESPACE}.{idx}")))
+            for idx in volumes
+        ]
 
-        oid = sensor["oid"]
-        key = sensor["key"]
-        transform = sensor.get("transform")
-        try:
-            error_indication, error_status, error_index, var_binds = await get_cmd(
-                engine,
-                auth_data,
-                target,
-                ContextData(),
-                ObjectType(ObjectIdentity(oid)),
-            )
-        except Exception as err:
-            _LOGGER.warning("Exception fetching OID %s: %s", oid, err)
-            result[key] = None
-            continue
+    return inventory, complete
 
-        if error_indication or error_status:
-            _LOGGER.warning(
-                "SNMP error for OID %s: %s %s", oid, error_indication, error_status
-            )
+
+async def fetch_scalar_data(session: SnmpSession, scalar_requests: list) -> dict:
+    """Fetch all scalar sensor OIDs via SNMP. Returns dict keyed by sensor key.
+
+    scalar_requests comes from build_scalar_requests(). Computed sensors are
+    not part of it; their values are derived from the fetched ones. A GET
+    that gets no response (timeout, transport error) raises, so the
+    coordinator fails the update and re-resolves the host.
+    """
+    result: dict = {}
+
+    # The OIDs are sent as varbinds of as few GET PDUs as possible, so the
+    # scalar phase usually costs one round trip instead of one per sensor.
+    values = await _get_values(
+        session,
+        [object_type for _, _, object_type in scalar_requests],
+    )
+    missing: list[str] = []
+    for (key, parser, _), value in zip(scalar_requests, values, strict=True):
+        if isinstance(value, (NoSuchObject, NoSuchInstance, EndOfMibView)):
+            missing.append(key)
             result[key] = None
+        elif isinstance(value, Integer):
+            # Integer32/Counter32/Counter64/Gauge32/TimeTicks decode to a
+            # native int; skip rendering them to text and parsing it back.
+            result[key] = parser(int(value))
         else:
-            raw_value = str(var_binds[0][1])
-            if key == "system_uptime":
-                parsed = parse_snmp_number(raw_value)
-                result[key] = round(parsed / 100, 1) if parsed is not None else None
-            elif "temperature" in key:
-                result[key] = parse_wd_temperature(raw_value)
-            elif transform == "kb_to_mib":
-                parsed = parse_snmp_number(raw_value)
-                result[key] = round(parsed / 1024, 1) if parsed is not None else None
-            else:
-                parsed = parse_snmp_number(raw_value)
-                result[key] = parsed if parsed is not None else raw_value
+            result[key] = parser(_value_text(value))
+    # One summary instead of a log call per sensor, and only for keys not
+    # reported before, so a device lacking an OID warns once per session.
+    unreported = [key for key in missing if key not in session.reported_missing]
+    if unreported:
+        session.reported_missing.update(unreported)
+        _LOGGER.warning("OIDs not available on device for sensors: %s", unreported)
 
     # Compute ram_used = ram_total - ram_free.
     # UCD-SNMP-MIB has no memUsedReal OID; ram_free maps to memAvailReal.
@@ -407,20 +771,47 @@ async def fetch_snmp_data(data: dict, sensors: list) -> dict:
     if ram_total is not None and ram_free is not None:
         result["ram_used"] = round(ram_total - ram_free, 1)
 
-    # Fetch dynamic WD disk table
-    try:
-        disks = await fetch_disk_table(data)
-        result["_disks"] = disks
-    except Exception as err:
-        _LOGGER.warning("Could not fetch WD disk table: %s", err)
-        result["_disks"] = []
+    return result
 
-    # Fetch dynamic WD volume/RAID table
-    try:
-        volumes = await fetch_volume_table(data)
-        result["_volumes"] = volumes
-    except Exception as err:
-        _LOGGER.warning("Could not fetch WD volume table: %s", err)
-        result["_volumes"] = []
 
+def _index_rows(rows: list[dict]) -> dict[str, dict]:
+    """Map table rows by their 'index' value."""
+    return {row["index"]: row for row in rows}
+
+
+async def fetch_snmp_data(
+    session: SnmpSession, scalar_requests: list, inventory: dict, parallel: bool = True
+) -> dict:
+    """Fetch scalar sensors plus the changing WD disk and volume columns.
+
+    inventory comes from fetch_inventory(). The three fetches are
+    independent; with parallel they run concurrently and a poll takes as
+    long as the slowest of them rather than their sum. Table data is added to the result
+    under '_disks' and '_volumes' keys, and indexed by table row under
+    '_disks_by_index' and '_volumes_by_index' for the entities; a failing
+    table fetch only empties its own keys.
+    """
+    result, disks, volumes = await _await_all(
+        [
+            fetch_scalar_data(session, scalar_requests),
+            fetch_disk_table(session, inventory),
+            fetch_volume_table(session, inventory),
+        ],
+        parallel,
+    )
+    if isinstance(result, BaseException):
+        raise result
+
+    if isinstance(disks, BaseException):
+        _LOGGER.warning("Could not fetch WD disk table: %s", disks)
+        disks = []
+    result["_disks"] = disks
+
+    if isinstance(volumes, BaseException):
+        _LOGGER.warning("Could not fetch WD volume table: %s", volumes)
+        volumes = []
+    result["_volumes"] = volumes
+
+    result["_disks_by_index"] = _index_rows(disks)
+    result["_volumes_by_index"] = _index_rows(volumes)
     return result
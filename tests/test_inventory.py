@@ -0,0 +1,107 @@
+"""Tests for the disk/volume inventory refresh when one table walk fails."""
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pysnmp.proto.rfc1902 import OctetString
+
+from custom_components.wd_ex2_ultra import WDEx2UltraCoordinator
+from custom_components.wd_ex2_ultra import snmp_helper
+from custom_components.wd_ex2_ultra.snmp_helper import CannotConnect, fetch_inventory
+
+pytestmark = pytest.mark.asyncio
+
+DISKS = {
+    "1": {"index": "1", "vendor": "WDC", "model": "WD40EFRX", "serial": "S1", "capacity": 4000.0},
+}
+VOLUMES = {
+    "1": {
+        "index": "1",
+        "name": "Volume_1",
+        "fstype": "ext4",
+        "raid_level": "RAID1",
+        "size_mb": 3800000.0,
+    },
+}
+EMPTY_INVENTORY = {"disks": {}, "volumes": {}, "disk_oids": [], "volume_oids": []}
+
+
+async def _timed_out(session):
+    raise CannotConnect("requestTimedOut")
+
+
+async def _disks(session):
+    return DISKS
+
+
+async def _volumes(session):
+    return VOLUMES
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+async def test_failed_table_keeps_previous_rows(parallel: bool) -> None:
+    """A table whose walk fails keeps its previous rows; the other is updated."""
+    previous = {
+        "disks": DISKS,
+        "volumes": {},
+        "disk_oids": ["cached disk OIDs"],
+        "volume_oids": [],
+    }
+    with patch.object(snmp_helper, "fetch_disk_inventory", _timed_out), patch.object(
+        snmp_helper, "fetch_volume_inventory", _volumes
+    ):
+        inventory, complete = await fetch_inventory(MagicMock(), previous, parallel)
+
+    assert not complete
+    assert inventory["disks"] is DISKS
+    assert inventory["disk_oids"] == ["cached disk OIDs"]
+    assert inventory["volumes"] is VOLUMES
+    assert [key for key, _ in inventory["volume_oids"]] == ["1"]
+
+
+async def test_coordinator_retries_after_one_table_failed(hass) -> None:
+    """The refresh interval only starts once both table walks succeeded."""
+    entry = MagicMock(data={}, options={})
+    coordinator = WDEx2UltraCoordinator(hass, entry, update_interval=timedelta(seconds=60))
+    coordinator._session = MagicMock()
+    assert coordinator._inventory == EMPTY_INVENTORY
+
+    with patch.object(snmp_helper, "fetch_disk_inventory", _timed_out), patch.object(
+        snmp_helper, "fetch_volume_inventory", _volumes
+    ):
+        await coordinator._async_refresh_inventory()
+
+    # The volume table is usable right away, the disk walk is due again
+    assert coordinator._inventory["volumes"] is VOLUMES
+    assert coordinator._inventory["disks"] == {}
+    assert coordinator._inventory_expiry == 0.0
+
+    with patch.object(snmp_helper, "fetch_disk_inventory", _disks), patch.object(
+        snmp_helper, "fetch_volume_inventory", _volumes
+    ):
+        await coordinator._async_refresh_inventory()
+
+    assert coordinator._inventory["disks"] is DISKS
+    assert [key for key, _ in coordinator._inventory["disk_oids"]] == [
+        ("1", "temperature"),
+        ("1", "status"),
+    ]
+    assert coordinator._inventory_expiry > 0.0
+
+
+async def test_walk_ending_in_error_status_fails() -> None:
+    """A GETBULK error status fails the walk instead of keeping its first rows."""
+    root = snmp_helper.WD_VOL_COL_NAME
+    responses = [
+        (None, 0, 0, ((f"{root}.1", OctetString("Volume_1")),)),
+        (None, 5, 1, ()),
+    ]
+
+    async def bulk_cmd(*args, **kwargs):
+        return responses.pop(0)
+
+    with patch.object(snmp_helper, "bulk_cmd", bulk_cmd):
+        with pytest.raises(CannotConnect):
+            await snmp_helper.bulk_fetch_table(MagicMock(), [root], max_repetitions=1)
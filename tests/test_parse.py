@@ -0,0 +1,22 @@
+"""Tests for the SNMP value parsers."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.wd_ex2_ultra.snmp_helper import parse_wd_temperature
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        ("Centigrade:48 \tFahrenheit:118", 48.0),
+        ("Fahrenheit:118 Centigrade:48", 48.0),
+        ("Fahrenheit:118 Centigrade:", None),
+        ("41", 41.0),
+        (41, 41.0),
+        ("", None),
+    ],
+)
+def test_parse_wd_temperature(raw_value, expected) -> None:
+    """The Centigrade field is used whatever the field order."""
+    assert parse_wd_temperature(raw_value) == expected
@@ -0,0 +1,114 @@
+"""Tests for fetching the scalar sensor OIDs."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pysnmp.proto.rfc1902 import Integer32
+from pysnmp.proto.rfc1905 import NoSuchObject
+
+from custom_components.wd_ex2_ultra import snmp_helper
+from custom_components.wd_ex2_ultra.const import SENSORS
+
+pytestmark = pytest.mark.asyncio
+
+
+def _answer(missing):
+    """get_cmd that answers every requested object except missing."""
+
+    async def get_cmd(engine, auth_data, target, context, *object_types, **kwargs):
+        var_binds = tuple(
+            (object_type, NoSuchObject("") if object_type is missing else Integer32(1))
+            for object_type in object_types
+        )
+        return None, 0, 0, var_binds
+
+    return get_cmd
+
+
+async def test_missing_oids_warn_once_per_session(caplog) -> None:
+    """An OID the device lacks is logged as a warning only on the first poll."""
+    requests = snmp_helper.build_scalar_requests(SENSORS)
+    key, _, object_type = requests[0]
+    session = snmp_helper.SnmpSession(MagicMock(), MagicMock())
+    get_cmd = _answer(object_type)
+
+    with patch.object(snmp_helper, "get_cmd", get_cmd):
+        with caplog.at_level(logging.WARNING):
+            first = await snmp_helper.fetch_scalar_data(session, requests)
+            second = await snmp_helper.fetch_scalar_data(session, requests)
+
+    assert first[key] is None and second[key] is None
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    assert key in warnings[0].getMessage()
+
+
+def _truncated(count: int):
+    """get_cmd that answers only the first count OIDs of each request."""
+
+    async def get_cmd(engine, auth_data, target, context, *object_types, **kwargs):
+        var_binds = tuple((object_type, Integer32(1)) for object_type in object_types)
+        return None, 0, 0, var_binds[:count]
+
+    return get_cmd
+
+
+async def test_truncated_response_leaves_out_missing_keys() -> None:
+    """Keys beyond a truncated GET response are left out, not shifted."""
+    session = snmp_helper.SnmpSession(MagicMock(), MagicMock())
+    size = snmp_helper.MAX_GET_VARBINDS
+    keys = [f"key{i}" for i in range(size + 1)]
+
+    # The first PDU answers all but its last OID; the second is complete.
+    with patch.object(snmp_helper, "get_cmd", _truncated(size - 1)):
+        values = await snmp_helper.get_oid_values(session, [(k, k) for k in keys])
+
+    dropped = keys[size - 1]
+    assert values == {key: "1" for key in keys if key != dropped}
+
+
+async def test_truncated_response_sets_missing_sensors_to_none() -> None:
+    """Sensors beyond a truncated GET response are None, not another's value."""
+    requests = snmp_helper.build_scalar_requests(SENSORS)
+    session = snmp_helper.SnmpSession(MagicMock(), MagicMock())
+
+    with patch.object(snmp_helper, "get_cmd", _truncated(1)):
+        data = await snmp_helper.fetch_scalar_data(session, requests)
+
+    assert set(data) >= {key for key, _, _ in requests}
+    assert [key for key, _, _ in requests if data[key] is None] == [
+        key for key, _, _ in requests[1:]
+    ]
+
+
+async def test_empty_single_get_response_sets_sensor_to_none() -> None:
+    """An empty answer to a one-OID retry GET is treated as a missing OID."""
+    requests = snmp_helper.build_scalar_requests(SENSORS)
+    session = snmp_helper.SnmpSession(MagicMock(), MagicMock())
+
+    async def get_cmd(engine, auth_data, target, context, *object_types, **kwargs):
+        # genErr for the batched GET, then no varbinds for each retry
+        return None, (5 if len(object_types) > 1 else 0), 0, ()
+
+    with patch.object(snmp_helper, "get_cmd", get_cmd):
+        data = await snmp_helper.fetch_scalar_data(session, requests)
+
+    assert all(data[key] is None for key, _, _ in requests)
+
+
+async def test_rejected_single_oid_get_is_missing_value() -> None:
+    """A genErr on a one-OID GET leaves that key out instead of raising."""
+    session = snmp_helper.SnmpSession(MagicMock(), MagicMock())
+    calls = []
+
+    async def get_cmd(engine, auth_data, target, context, *object_types, **kwargs):
+        calls.append(len(object_types))
+        return None, 5, 1, ()
+
+    with patch.object(snmp_helper, "get_cmd", get_cmd):
+        values = await snmp_helper.get_oid_values(session, [("free_mb", MagicMock())])
+
+    assert values == {}
+    assert calls == [1]
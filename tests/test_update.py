@@ -0,0 +1,97 @@
+"""Tests for failed coordinator updates."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pysnmp.proto.rfc1902 import Integer32
+
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.wd_ex2_ultra import WDEx2UltraCoordinator, async_setup_entry
+from custom_components.wd_ex2_ultra import snmp_helper
+from custom_components.wd_ex2_ultra.const import SCAN_INTERVAL_OPTIONS, SENSORS
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _no_response(*args, **kwargs):
+    """get_cmd/bulk_cmd result for an agent that does not answer."""
+    return "No SNMP response received before timeout", 0, 0, ()
+
+
+def _coordinator(hass, scan_interval: float = 60) -> WDEx2UltraCoordinator:
+    """Coordinator with a resolved target and a fresh (empty) inventory."""
+    entry = MagicMock(data={"host": "nas.local"}, options={})
+    coordinator = WDEx2UltraCoordinator(
+        hass, entry, update_interval=timedelta(seconds=scan_interval)
+    )
+    coordinator._session = MagicMock()
+    coordinator._scalar_requests = snmp_helper.build_scalar_requests(SENSORS)
+    coordinator._target_expiry = time.monotonic() + 3600
+    coordinator._inventory_expiry = time.monotonic() + 3600
+    return coordinator
+
+
+@pytest.mark.parametrize("scan_interval", SCAN_INTERVAL_OPTIONS)
+async def test_unreachable_nas_fails_update_and_resolves_again(
+    hass, scan_interval: int
+) -> None:
+    """A scalar GET without response fails the update at every interval."""
+    coordinator = _coordinator(hass, scan_interval)
+
+    with patch.object(snmp_helper, "get_cmd", _no_response):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+
+    assert coordinator._target_expiry == 0.0
+
+
+def _slow_answer(delay: float):
+    """get_cmd that answers every OID after delay seconds."""
+
+    async def get_cmd(engine, auth_data, target, context, *object_types, **kwargs):
+        await asyncio.sleep(delay)
+        return None, 0, 0, tuple((object_type, Integer32(1)) for object_type in object_types)
+
+    return get_cmd
+
+
+async def test_slow_update_within_budget_succeeds(hass) -> None:
+    """A slow NAS that answers within 80 % of the scan interval still updates."""
+    coordinator = _coordinator(hass, scan_interval=0.5)
+
+    with patch.object(snmp_helper, "get_cmd", _slow_answer(0.05)):
+        data = await coordinator._async_update_data()
+
+    assert data["cpu_load_1min"] == 1.0
+
+
+async def test_update_over_budget_fails(hass) -> None:
+    """An update that runs past 80 % of the scan interval is cut off."""
+    coordinator = _coordinator(hass, scan_interval=0.5)
+
+    with patch.object(snmp_helper, "get_cmd", _slow_answer(1.0)):
+        with pytest.raises(UpdateFailed, match="timed out"):
+            await coordinator._async_update_data()
+
+    assert coordinator._target_expiry == 0.0
+
+
+async def test_failed_first_refresh_closes_session(hass) -> None:
+    """A setup that fails its first refresh releases the SNMP engine."""
+    entry = MagicMock(data={"host": "nas.local"}, options={})
+
+    with patch.object(
+        WDEx2UltraCoordinator,
+        "async_config_entry_first_refresh",
+        side_effect=ConfigEntryNotReady,
+    ), patch.object(WDEx2UltraCoordinator, "close_session") as close_session:
+        with pytest.raises(ConfigEntryNotReady):
+            await async_setup_entry(hass, entry)
+
+    close_session.assert_called_once()